@@ -4,6 +4,7 @@ import os
 from onemodel.repl import Repl
 from onemodel.onemodel_walker import load_file
 from onemodel.package_manager import PackageManager
+from onemodel.utils.write_if_changed import write_if_changed
 
 def main():
     if len( sys.argv ) > 1:
@@ -20,12 +21,9 @@ def main():
             onemodel = load_file(filename)
             sbml = onemodel.get_SBML_string()
 
-            if not os.path.exists("./build"):
-                os.mkdir("build")
+            os.makedirs("build", exist_ok=True)
 
-            file = open("build/" + onemodel.model_name + ".xml", "w")
-            file.write(sbml)
-            file.close()
+            write_if_changed("build/" + onemodel.model_name + ".xml", sbml)
 
         if cmd == "install":
             pm = PackageManager()
@@ -1,5 +1,3 @@
-import sys
-
 from onemodel.objects.builtin_function import BuiltinFunction
 
 
@@ -31,8 +29,10 @@ def print_(scope):
     return None
 add_builtin_function("print", ["value"], print_)
 
-def globals_(scope):
-    namespace = scope.namespaces[0]
+def namespace_table(namespace):
+    """ Returns a table with the name, value and documentation of each
+    object in a namespace.
+    """
 
     from tabulate import tabulate
     
@@ -52,7 +52,12 @@ def globals_(scope):
 
     result = tabulate(data, headers=['Name', 'Value', 'Documentation'])
 
-    print(result)
+    return result
+
+def globals_(scope):
+    namespace = scope.namespaces[0]
+
+    print(namespace_table(namespace))
     print()
  
     return None
@@ -63,25 +68,7 @@ def locals_(scope):
 
     namespace = scope.namespaces[-2]
 
-    from tabulate import tabulate
-    
-    data = []
-    
-    for name in reversed(list(namespace.keys())):
-
-        value = repr(namespace[name])
-    
-        if isinstance(namespace[name], dict):
-            doc = namespace[name]['__doc__']
-        else:
-            doc =""
-    
-        row = [name, value, doc]
-        data.append(row)
-
-    result = tabulate(data, headers=['Name', 'Value', 'Documentation'])
-
-    print(result)
+    print(namespace_table(namespace))
     print()
     
     return None
@@ -99,25 +86,7 @@ def show(scope):
 
         return None
 
-    from tabulate import tabulate
-    
-    data = []
-    
-    for name in reversed(list(namespace.keys())):
-
-        value = repr(namespace[name])
-    
-        if isinstance(namespace[name], dict):
-            doc = namespace[name]['__doc__']
-        else:
-            doc =""
-    
-        row = [name, value, doc]
-        data.append(row)
-
-    result = tabulate(data, headers=['Name', 'Value', 'Documentation'])
-
-    print(result)
+    print(namespace_table(namespace))
     print()
     
     return None
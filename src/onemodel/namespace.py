@@ -11,6 +11,8 @@ class Namespace(dict):
     extra methods.  
     """
 
+    __slots__ = ()
+
     def is_empty(self):
         """Returns True if the Namespace is empty, and False otherwise.
         """
@@ -16,6 +16,8 @@ class AlgebraicRule(Object):
         The math expression to evaluate.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self["variable"] = ""
@@ -1,5 +1,4 @@
 from onemodel.objects.object import Object
-from onemodel.scope import Scope
 from onemodel.namespace import Namespace
 
 
@@ -12,6 +11,8 @@ class BaseFunction(Object):
         Names of the arguments.
     """
 
+    __slots__ = ("walker",)
+
     def __init__(self):
         super().__init__()
 
@@ -52,11 +53,11 @@ class BaseFunction(Object):
 
         result = Namespace()
 
-        if argument_values is None:
+        # Calls without arguments (None or []) have nothing to bind.
+        if not argument_values:
             return result
 
-        for name, value in zip(self["argument_names"], argument_values):
-            result[name] = value
+        result.update(zip(self["argument_names"], argument_values))
 
         return result
 
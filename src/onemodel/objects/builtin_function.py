@@ -12,6 +12,8 @@ class BuiltinFunction (BaseFunction):
         A Python function object.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
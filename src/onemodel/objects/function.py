@@ -11,6 +11,8 @@ class Function(BaseFunction):
         The abstract syntax tree of the OneModel function.
     """
 
+    __slots__ = ()
+
     def execute(self, scope):
         """ Run the builtin function given the scope. """
         result = self.walker.walk(self["body"])
@@ -10,6 +10,8 @@ class Model(BaseFunction):
         The abstract syntax tree of the body of a model.
     """
 
+    __slots__ = ()
+
     def execute(self, scope):
         """ Run the builtin function given the scope. """
 
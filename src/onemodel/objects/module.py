@@ -46,9 +46,8 @@ def load_module(walker, module_name, import_name=None, assign_name=None, qualifi
     module["__name__"] = module_name
     module["__file__"] = filename
 
-    file = open(filename)
-    text = file.read()
-    file.close()
+    with open(filename, encoding="utf-8") as file:
+        text = file.read()
     
     walker.onemodel.push(module)
     walker.run(text)
@@ -87,6 +86,8 @@ class Module(Object):
         Absolute path to the file which contains the module.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self["__name__"] = ""
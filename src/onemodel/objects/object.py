@@ -8,6 +8,8 @@ class Object(Namespace):
     OneModel elements.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
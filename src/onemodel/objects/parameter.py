@@ -17,6 +17,8 @@ class Parameter(Object):
         Units of the parameter.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
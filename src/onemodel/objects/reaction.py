@@ -1,4 +1,4 @@
-from libsbml import Species, parseL3Formula
+from libsbml import parseL3Formula
 
 from onemodel.utils.check import check
 from onemodel.utils.get_ast_names import get_ast_names
@@ -17,6 +17,8 @@ class Reaction(Object):
     reversible : :obj:`bool`
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self["reactants"] = []
@@ -27,8 +29,8 @@ class Reaction(Object):
     def add_to_SBML_model(self, name, scope, model):
         """Include this object into a SBML model. """
 
-        # List of species involved as reactans or products in the reaction.
-        species_involved = []
+        # Set of species involved as reactans or products in the reaction.
+        species_involved = set()
 
         r = self.create_SBML_reaction(name, scope, model)
         self.create_SBML_reaction_reactants(r, species_involved, scope)
@@ -85,7 +87,7 @@ class Reaction(Object):
                 f'set "constant" on species {fullname}'
             )
 
-            species_involved.append(fullname)
+            species_involved.add(fullname)
 
     def create_SBML_reaction_products(self, reaction, species_involved, scope):
         """Create and add the SBML products. """
@@ -113,7 +115,7 @@ class Reaction(Object):
                 f'set "constant" on species {fullname}'
             )
 
-            species_involved.append(name)
+            species_involved.add(fullname)
 
     def create_SBML_reaction_kinetic_law(self, reaction, model, species_involved, scope):
         """Add the kinetic law to the reaction"""
@@ -144,12 +146,11 @@ class Reaction(Object):
         names_modifier = []
 
         for name in names:
-            elem = model.getElementBySId(name)
-
-            if type(elem) != Species:
+            if name in species_involved:
                 continue
 
-            if name in species_involved:
+            # Only species can be modifiers.
+            if model.getSpecies(name) is None:
                 continue
 
             names_modifier.append(name)
@@ -15,6 +15,8 @@ class Species(Object):
     hasOnlySubstanceUnits : :obj:`bool`
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self["compartment"] = "default_compartment"
@@ -1,6 +1,7 @@
 import libsbml
 from libsbml import UNIT_KIND_SECOND, SBMLDocument
 
+from onemodel.builtin_functions import builtin_functions
 from onemodel.utils.check import check
 from onemodel.namespace import Namespace
 from onemodel.scope import Scope
@@ -116,7 +117,7 @@ class OneModel(Scope):
             if name.startswith('__'):
                 continue
 
-            if name in ["show", "locals", "globals", "print", "exit"]:
+            if name in builtin_functions:
                 continue
 
             value = repr(self.root[name])
@@ -1,9 +1,9 @@
 import os
+from functools import lru_cache
 from importlib_resources import files
 import tatsu
 from tatsu.walkers import NodeWalker
 from onemodel.onemodel import OneModel
-from onemodel.objects.object import Object
 from onemodel.objects.parameter import Parameter
 from onemodel.objects.species import Species
 from onemodel.objects.reaction import Reaction
@@ -12,8 +12,6 @@ from onemodel.objects.algebraic_rule import AlgebraicRule
 from onemodel.objects.rate_rule import RateRule
 from onemodel.objects.function import Function
 from onemodel.objects.model import Model
-from onemodel.objects.module import Module
-from onemodel.objects.module import find_module
 from onemodel.objects.module import load_module
 from onemodel.builtin_functions import load_builtin_functions
 
@@ -30,9 +28,9 @@ def load_file(filename):
     """Load a file into OneModel. """
 
     filepath = os.path.abspath(filename)
-    file = open(filepath)
-    text = file.read()
-    file.close()
+
+    with open(filepath, encoding="utf-8") as file:
+        text = file.read()
 
     walker = OneModelWalker(file=filepath)
     result, ast = walker.run(text)
@@ -41,6 +39,21 @@ def load_file(filename):
 
     return onemodel
 
+@lru_cache(maxsize=1)
+def get_parser():
+    """Returns the parser of the OneModel grammar.
+
+    Notes
+    -----
+    Compiling the grammar is expensive and its result never changes, so it
+    is done only once and shared by every walker.
+    """
+
+    grammar = files("onemodel").joinpath("onemodel.ebnf").read_text()
+    parser = tatsu.compile(grammar, asmodel=True)
+
+    return parser
+
 class OneModelWalker(NodeWalker):
 
     numberOfUnnamedReactions = 0
@@ -61,8 +74,29 @@ class OneModelWalker(NodeWalker):
 
         load_builtin_functions(self.onemodel)
 
-        grammar = files("onemodel").joinpath("onemodel.ebnf").read_text()
-        self.parser = tatsu.compile(grammar, asmodel=True)
+        self.parser = get_parser()
+
+        # Map the name of each node type to its walk_<name> method.
+        self.dispatch_table = {}
+        for attribute in dir(self):
+            if attribute.startswith("walk_"):
+                self.dispatch_table[attribute[5:]] = getattr(self, attribute)
+
+    def walk(self, node, *args, **kwargs):
+        """Walk a node of the ast.
+
+        Notes
+        -----
+        This is the hot path of the walker, so the method for each node type
+        is found with a single lookup in the dispatch table. Node types
+        without a walk_<name> method are handled by NodeWalker.
+        """
+        walker = self.dispatch_table.get(type(node).__name__)
+
+        if walker is None:
+            return super().walk(node, *args, **kwargs)
+
+        return walker(node, *args, **kwargs)
 
     def run(self, onemodel_code):
 
@@ -377,3 +411,7 @@ class OneModelWalker(NodeWalker):
 
     def walk_tuple(self, nodes):
         return self.walk_list(nodes)
+
+    def walk_NoneType(self, node):
+        """Optional elements missing in the code are None nodes. """
+        return None
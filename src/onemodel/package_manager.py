@@ -1,7 +1,6 @@
-import os
 import tomli
 import shutil
-from git import Repo
+from concurrent.futures import ThreadPoolExecutor
 
 def install_dependencies():
     pm = PackageManager()
@@ -26,8 +25,23 @@ class PackageManager:
 
         shutil.rmtree("./lib/")
 
-        for name, url in self.dependencies().items():
-            Repo.clone_from(url, f"lib/{name}")
-            print(f'Installed {url} as "{name}"')
+        # Each dependency is cloned into its own folder, so the clones are
+        # independent and can be downloaded at the same time.
+        with ThreadPoolExecutor() as executor:
+            installed = executor.map(
+                lambda item: self.install_dependency(*item),
+                self.dependencies().items()
+            )
+
+            for name, url in installed:
+                print(f'Installed {url} as "{name}"')
 
         print("All dependencies installed.")
+
+    def install_dependency(self, name, url):
+        # GitPython is slow to import and only needed here.
+        from git import Repo
+
+        Repo.clone_from(url, f"lib/{name}")
+
+        return name, url
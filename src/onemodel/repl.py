@@ -4,9 +4,7 @@ import atexit
 # TODO: use this again
 # from importlib.metadata import version 
 
-import onemodel
 from onemodel.onemodel_walker import OneModelWalker
-from tatsu.exceptions import FailedLeftRecursion
 
 def shell():
     repl = Repl()
@@ -62,14 +60,14 @@ class Repl:
         """Print the result."""
 
         if isinstance(evaluation_result, list):
-            result = None
+            if not evaluation_result:
+                return None
+
+            lines = []
             for item in evaluation_result:
                 printed = self.printResult(item)
-                if result is None:
-                    result = str(printed)
-                else:
-                    result += '\n' + str(printed)
-            return result
+                lines.append(str(printed))
+            return '\n'.join(lines)
 
         result = self.printResult(evaluation_result)
 
@@ -1,4 +1,4 @@
-from libsbml import LIBSBML_OPERATION_SUCCESS
+from libsbml import LIBSBML_OPERATION_SUCCESS, OperationReturnValue_toString
 
 
 def check(value, message):
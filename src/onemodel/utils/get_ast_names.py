@@ -1,15 +1,22 @@
-def get_ast_names(ast):
-    """Returns the user defined names in a MathML ast."""
-    names = []
+def get_ast_names(ast, names=None):
+    """Returns the user defined names in a MathML ast.
+
+    Parameters
+    ----------
+    ast : :obj:`ASTNode`
+        The libSBML MathML ast to search.
+    names : :obj:`list` of :obj:`str`, optional
+        List where the names found are appended. If None, a new list is
+        created.
+    """
+    if names is None:
+        names = []
 
     if ast.isName():
         names.append(ast.getName())
 
     for i in range(ast.getNumChildren()):
         child = ast.getChild(i)
-        child_names = get_ast_names(child)
-
-        for item in child_names:
-            names.append(item)
+        get_ast_names(child, names)
 
     return names
@@ -1,5 +1,34 @@
-from io import BytesIO
-from tokenize import ENCODING, NAME, OP, tokenize
+import re
+from functools import lru_cache
+
+# Tokens of a math formula: numbers, names, whitespace and any other single
+# character (operators, parentheses, commas, ...).
+TOKEN_REGEX = re.compile(
+    r"(?P<NUMBER>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<NAME>[^\W\d]\w*)"
+    r"|(?P<WHITESPACE>\s+)"
+    r"|(?P<OP>.)"
+)
+
+@lru_cache(maxsize=1024)
+def tokenize_math(math_expr):
+    """Splits a math formula into a tuple of (type, value) tokens.
+
+    Notes
+    -----
+    Whitespace is discarded. The tokens only depend on the formula, so they
+    are cached: the same formula is often used by many objects of a model
+    (e.g. every instance of a model shares its kinetic laws).
+    """
+    result = []
+
+    for match in TOKEN_REGEX.finditer(math_expr):
+        if match.lastgroup == "WHITESPACE":
+            continue
+
+        result.append((match.lastgroup, match.group()))
+
+    return tuple(result)
 
 def math_2_fullname(math_expr, scope):
     """Changes local user defined names into fullnames.
@@ -10,28 +39,22 @@ def math_2_fullname(math_expr, scope):
     """
     result = ""
 
-    g = tokenize(BytesIO(math_expr.encode("utf-8")).readline)
-
     last_tokval = None
 
-    for toknum, tokval, _, _, _ in g:
-        if toknum == ENCODING:
-            continue
+    # Bind the method once, it is called for every name in the formula.
+    get_fullname = scope.get_fullname
 
-        if str(last_tokval) == "." and toknum == NAME:
+    for toknum, tokval in tokenize_math(math_expr):
+        if last_tokval == "." and toknum == "NAME":
             result = result[0:-1]
             result += "__"
 
-        if toknum == NAME:
-            try:
-                fullname = scope.get_fullname(str(tokval))
-                result += fullname
-            except:
-                result += str(tokval)
+        if toknum == "NAME":
+            result += get_fullname(tokval)
 
         else:
-            result += str(tokval)
+            result += tokval
 
         last_tokval = tokval
 
-    return str(result)
+    return result
@@ -0,0 +1,22 @@
+import os
+
+
+def write_if_changed(filepath, text):
+    """Write text into a file, unless the file already has that content.
+
+    Parameters
+    ----------
+    filepath : :obj:`str`
+        Path of the file to write.
+    text : :obj:`str`
+        Content of the file, it is written encoded as UTF-8.
+    """
+    data = text.encode("utf-8")
+
+    if os.path.isfile(filepath):
+        with open(filepath, "rb") as file:
+            if file.read() == data:
+                return
+
+    with open(filepath, "wb") as file:
+        file.write(data)
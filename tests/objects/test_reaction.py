@@ -145,3 +145,22 @@ def test_reference_nested():
     expected = ElementTree.fromstring(expected_string)
 
     assert ElementTree.tostring(result) == ElementTree.tostring(expected)
+
+def test_product_in_kinetic_law_is_not_modifier():
+
+    m = OneModel()
+
+    m["M"] = Object()
+    m["M"]["A"] = Species()
+    m["M"]["B"] = Species()
+    m["M"]["k"] = Parameter()
+
+    m["M"]["J1"] = Reaction()
+    m["M"]["J1"]["reactants"] = ["A"]
+    m["M"]["J1"]["products"] = ["B"]
+    m["M"]["J1"]["kinetic_law"] = "k*A*B"
+
+    result_string = m.get_SBML_string()
+
+    assert 'species="M__B"' in result_string
+    assert "modifierSpeciesReference" not in result_string
@@ -0,0 +1,22 @@
+from libsbml import LIBSBML_INVALID_ATTRIBUTE_VALUE, LIBSBML_OPERATION_SUCCESS
+import pytest
+
+from onemodel.utils.check import check
+
+
+def test_check_success():
+    assert check(LIBSBML_OPERATION_SUCCESS, "do something") is None
+    assert check("not a return code", "do something") is None
+
+def test_check_none():
+    with pytest.raises(SystemExit) as e:
+        check(None, "do something")
+
+    assert "do something" in str(e.value)
+
+def test_check_error_code():
+    with pytest.raises(SystemExit) as e:
+        check(LIBSBML_INVALID_ATTRIBUTE_VALUE, "set id")
+
+    assert "set id" in str(e.value)
+    assert str(LIBSBML_INVALID_ATTRIBUTE_VALUE) in str(e.value)
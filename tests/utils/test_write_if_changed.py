@@ -0,0 +1,58 @@
+import os
+
+from onemodel.utils.write_if_changed import write_if_changed
+
+
+def test_write_if_changed_new_file(tmpdir):
+    filepath = str(tmpdir.join("model.xml"))
+
+    write_if_changed(filepath, "<sbml/>\n")
+
+    with open(filepath, "rb") as file:
+        assert file.read() == b"<sbml/>\n"
+
+def test_write_if_changed_unchanged(tmpdir):
+    filepath = str(tmpdir.join("model.xml"))
+
+    write_if_changed(filepath, "<sbml/>\n")
+    os.utime(filepath, (0, 0))
+
+    write_if_changed(filepath, "<sbml/>\n")
+
+    assert os.path.getmtime(filepath) == 0
+
+def test_write_if_changed_changed(tmpdir):
+    filepath = str(tmpdir.join("model.xml"))
+
+    write_if_changed(filepath, "<sbml/>\n")
+    write_if_changed(filepath, "<sbml></sbml>\n")
+
+    with open(filepath, "rb") as file:
+        assert file.read() == b"<sbml></sbml>\n"
+
+def test_write_if_changed_crlf(tmpdir):
+    filepath = str(tmpdir.join("model.xml"))
+
+    with open(filepath, "wb") as file:
+        file.write(b"<sbml/>\r\n")
+
+    write_if_changed(filepath, "<sbml/>\n")
+
+    with open(filepath, "rb") as file:
+        assert file.read() == b"<sbml/>\n"
+
+    os.utime(filepath, (0, 0))
+    write_if_changed(filepath, "<sbml/>\n")
+
+    assert os.path.getmtime(filepath) == 0
+
+def test_write_if_changed_undecodable(tmpdir):
+    filepath = str(tmpdir.join("model.xml"))
+
+    with open(filepath, "wb") as file:
+        file.write(b"\xff\xfe junk")
+
+    write_if_changed(filepath, "<sbml/>")
+
+    with open(filepath, "rb") as file:
+        assert file.read() == b"<sbml/>"